@@ -11,7 +11,7 @@ conda_create ()
     conda update -q conda
     conda config --add channels pypi
     conda info -a
-    deps='six coverage numpy scipy pandas decorator sphinx matplotlib'
+    deps='coverage numpy scipy pandas decorator sphinx matplotlib'
 
     conda create -q -n $ENV_NAME "python=$TRAVIS_PYTHON_VERSION" $deps
 }
@@ -30,8 +30,6 @@ if [ ! -d "$src" ]; then
         export PATH="$src/bin:$PATH"
         conda_create 
         source activate $ENV_NAME
-        # later versions than 5.2 do not support python 3.4 anymore
-        pip install PyYAML==5.2; python_version==3.4
         pip install python-coveralls
         source deactivate
     popd
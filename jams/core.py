@@ -40,7 +40,6 @@ import re
 import warnings
 import contextlib
 import gzip
-import six
 
 import numpy as np
 import pandas as pd
@@ -68,7 +67,7 @@ def deprecated(version, version_removed):
 
     def __wrapper(func, *args, **kwargs):
         '''Warn the user, and then proceed.'''
-        code = six.get_function_code(func)
+        code = func.__code__
         warnings.warn_explicit(
             "{:s}.{:s}\n\tDeprecated as of JAMS version {:s}."
             "\n\tIt will be removed in JAMS version {:s}."
@@ -121,7 +120,7 @@ def _open(name_or_fdesc, mode='r', fmt='auto'):
     if hasattr(name_or_fdesc, 'read') or hasattr(name_or_fdesc, 'write'):
         yield name_or_fdesc
 
-    elif isinstance(name_or_fdesc, six.string_types):
+    elif isinstance(name_or_fdesc, str):
         # Infer the opener from the extension
 
         if fmt == 'auto':
@@ -245,7 +244,7 @@ class JObject(object):
         '''
         super(JObject, self).__init__()
 
-        for name, value in six.iteritems(kwargs):
+        for name, value in kwargs.items():
             setattr(self, name, value)
 
     @property
@@ -266,7 +265,7 @@ class JObject(object):
         """
         filtered_dict = dict()
 
-        for k, item in six.iteritems(self.__dict__):
+        for k, item in self.__dict__.items():
             if k.startswith('_'):
                 continue
 
@@ -283,7 +282,9 @@ class JObject(object):
         return cls(**kwargs)
 
     def __eq__(self, other):
-        return (isinstance(other, self.__class__) and
+        if self is other:
+            return True
+        return (type(self) is type(other) and
                 (self.__dict__ == other.__dict__))
 
     def __nonzero__(self):
@@ -450,7 +451,7 @@ class JObject(object):
         >>> J.dumps()
         '{"foo": 5, "bar": "baz"}'
         '''
-        for name, value in six.iteritems(kwargs):
+        for name, value in kwargs.items():
             setattr(self, name, value)
 
     @property
@@ -536,7 +537,7 @@ class JObject(object):
         myself = self.__class__.__name__
 
         # Pop this object name off the query
-        for k, value in six.iteritems(kwargs):
+        for k, value in kwargs.items():
             k_pop = query_pop(k, myself)
 
             if k_pop:
@@ -693,10 +694,8 @@ class Annotation(JObject):
         >>> ann.append(time=3, duration=2, value='E#')
         '''
 
-        self.data.add(Observation(time=float(time),
-                                  duration=float(duration),
-                                  value=value,
-                                  confidence=confidence))
+        self.data.add(self._observation(time=time, duration=duration,
+                                        value=value, confidence=confidence))
 
     def append_records(self, records):
         '''Add observations from row-major storage.
@@ -708,11 +707,14 @@ class Annotation(JObject):
         records : iterable of dicts or Observations
             Each element of `records` corresponds to one observation.
         '''
+        observations = []
         for obs in records:
             if isinstance(obs, Observation):
-                self.append(**obs._asdict())
-            else:
-                self.append(**obs)
+                obs = obs._asdict()
+            observations.append(self._observation(**obs))
+
+        # Insert all observations with a single sort
+        self.data.update(observations)
 
     def append_columns(self, columns):
         '''Add observations from column-major storage.
@@ -726,12 +728,13 @@ class Annotation(JObject):
             and each much be a list of equal length.
 
         '''
-        self.append_records([dict(time=t, duration=d, value=v, confidence=c)
-                             for (t, d, v, c)
-                             in six.moves.zip(columns['time'],
-                                              columns['duration'],
-                                              columns['value'],
-                                              columns['confidence'])])
+        self.data.update([self._observation(time=t, duration=d,
+                                            value=v, confidence=c)
+                          for (t, d, v, c)
+                          in zip(columns['time'],
+                                 columns['duration'],
+                                 columns['value'],
+                                 columns['confidence'])])
 
     def validate(self, strict=True):
         '''Validate this annotation object against the JAMS schema,
@@ -760,8 +763,8 @@ class Annotation(JObject):
         JObject.validate
         '''
 
-        # Get the schema for this annotation
-        ann_schema = schema.namespace_array(self.namespace)
+        # Get the validator for this annotation's namespace
+        ann_validator = schema.namespace_validator(self.namespace)
 
         valid = True
 
@@ -771,7 +774,7 @@ class Annotation(JObject):
 
             # validate each record in the frame
             data_ser = [serialize_obj(obs) for obs in self.data]
-            schema.VALIDATOR.validate(data_ser, ann_schema)
+            ann_validator.validate(data_ser)
 
         except jsonschema.ValidationError as invalid:
             if strict:
@@ -1077,15 +1080,18 @@ class Annotation(JObject):
             List view of value field.
         '''
 
-        ints, vals = [], []
-        for obs in self.data:
-            ints.append([obs.time, obs.time + obs.duration])
-            vals.append(obs.value)
+        n = len(self.data)
 
-        if not ints:
-            return np.empty(shape=(0, 2), dtype=float), []
+        ints = np.empty(shape=(n, 2), dtype=float)
+        ints[:, 0] = np.fromiter((obs.time for obs in self.data),
+                                 dtype=float, count=n)
+        ints[:, 1] = np.fromiter((obs.duration for obs in self.data),
+                                 dtype=float, count=n)
+        ints[:, 1] += ints[:, 0]
 
-        return np.array(ints), vals
+        vals = [obs.value for obs in self.data]
+
+        return ints, vals
 
     def to_event_values(self):
         '''Extract observation data in a `mir_eval`-friendly format.
@@ -1098,12 +1104,11 @@ class Annotation(JObject):
         labels : list
             List view of value field.
         '''
-        ints, vals = [], []
-        for obs in self.data:
-            ints.append(obs.time)
-            vals.append(obs.value)
+        times = np.fromiter((obs.time for obs in self.data),
+                            dtype=float, count=len(self.data))
+        vals = [obs.value for obs in self.data]
 
-        return np.array(ints), vals
+        return times, vals
 
     def to_dataframe(self):
         '''Convert this annotation to a pandas dataframe.
@@ -1269,7 +1274,7 @@ class Annotation(JObject):
         """
         filtered_dict = dict()
 
-        for k, item in six.iteritems(self.__dict__):
+        for k, item in self.__dict__.items():
             if k.startswith('_'):
                 continue
             elif k == 'data':
@@ -1290,18 +1295,23 @@ class Annotation(JObject):
         r"""JSON-serialize the observation sequence."""
         if schema.is_dense(self.namespace):
             dense_records = dict()
-            for field in Observation._fields:
-                dense_records[field] = []
-
-            for obs in self.data:
-                for key, val in six.iteritems(obs._asdict()):
-                    dense_records[key].append(serialize_obj(val))
+            for i, field in enumerate(Observation._fields):
+                dense_records[field] = [serialize_obj(obs[i])
+                                        for obs in self.data]
 
             return dense_records
 
         else:
             return [serialize_obj(_) for _ in self.data]
 
+    @staticmethod
+    def _observation(time=None, duration=None, value=None, confidence=None):
+        '''Construct an Observation with numeric timing fields'''
+        return Observation(time=float(time),
+                           duration=float(duration),
+                           value=value,
+                           confidence=confidence)
+
     @classmethod
     def _key(cls, obs):
         '''Provides sorting index for Observation objects'''
@@ -1536,7 +1546,7 @@ class AnnotationArray(list):
         # if we have only one argument, it can be an int, slice or query
         if isinstance(idx, (int, slice)):
             return list.__getitem__(self, idx)
-        elif isinstance(idx, six.string_types) or six.callable(idx):
+        elif isinstance(idx, str) or callable(idx):
             return self.search(namespace=idx)
         elif isinstance(idx, tuple):
             return self.search(namespace=idx[0])[idx[1]]
@@ -1776,8 +1786,10 @@ class JAMS(JObject):
 
         self.validate(strict=strict)
 
+        # Encode to a single string first: json.dump would issue one
+        # write per token, which is slow on (gzip) file objects
         with _open(path_or_file, mode='w', fmt=fmt) as fdesc:
-            json.dump(self.__json__, fdesc, indent=2)
+            fdesc.write(json.dumps(self.__json__, indent=2))
 
     def validate(self, strict=True):
         '''Validate a JAMS object against the schema.
@@ -1994,7 +2006,7 @@ class JAMS(JObject):
         """
         filtered_dict = dict()
 
-        for k, item in six.iteritems(self.__dict__):
+        for k, item in self.__dict__.items():
             if k.startswith('_') or k == 'annotations':
                 continue
 
@@ -2068,11 +2080,10 @@ def match_query(string, query):
 
     '''
 
-    if six.callable(query):
+    if callable(query):
         return query(string)
 
-    elif (isinstance(query, six.string_types) and
-          isinstance(string, six.string_types)):
+    elif isinstance(query, str) and isinstance(string, str):
         return re.match(query, string) is not None
 
     else:
@@ -2100,7 +2111,7 @@ def serialize_obj(obj):
         return [serialize_obj(x) for x in obj]
 
     elif isinstance(obj, Observation):
-        return {k: serialize_obj(v) for k, v in six.iteritems(obj._asdict())}
+        return {k: serialize_obj(v) for k, v in zip(obj._fields, obj)}
 
     return obj
 
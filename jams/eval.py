@@ -20,7 +20,6 @@ Evaluation
 
 from collections import defaultdict
 
-import six
 import numpy as np
 import mir_eval
 
@@ -64,10 +63,14 @@ def coerce_annotation(ann, namespace):
     jams.nsconvert.convert
     '''
 
-    ann = convert(ann, namespace)
-    ann.validate(strict=True)
+    ann_coerced = convert(ann, namespace)
 
-    return ann
+    # convert() has already validated the input, so only a newly
+    # converted annotation needs to be checked again
+    if ann_coerced is not ann:
+        ann_coerced.validate(strict=True)
+
+    return ann_coerced
 
 
 def beat(ref, est, **kwargs):
@@ -449,7 +452,7 @@ def pattern_to_mireval(ann):
         patterns[pattern_id][occurrence_id].append(obs)
 
     # Convert to list-list-tuple format for mir_eval
-    return [list(_.values()) for _ in six.itervalues(patterns)]
+    return [list(_.values()) for _ in patterns.values()]
 
 
 def pattern(ref, est, **kwargs):
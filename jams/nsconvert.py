@@ -11,6 +11,8 @@ Namespace conversion
     convert
 '''
 
+import re
+
 import numpy as np
 
 from copy import deepcopy
@@ -22,6 +24,12 @@ from .exceptions import NamespaceError
 # The structure that handles all conversion mappings
 __CONVERSION__ = defaultdict(defaultdict)
 
+# Compiled source namespace patterns
+__SOURCE_PATTERN__ = dict()
+
+# Resolved conversions: (source namespace, target namespace) -> func or None
+__CONVERTER__ = dict()
+
 __all__ = ['convert', 'can_convert']
 
 
@@ -39,11 +47,39 @@ def _conversion(target, source):
     def register(func):
         '''This decorator registers func as mapping source to target'''
         __CONVERSION__[target][source] = func
+        __SOURCE_PATTERN__[source] = re.compile(source)
+        __CONVERTER__.clear()
         return func
 
     return register
 
 
+def _get_conversion(namespace, target_namespace):
+    '''Find the registered conversion from `namespace` to `target_namespace`.
+
+    Results are cached, so the source patterns are only matched once
+    per pair of namespaces.
+
+    Returns
+    -------
+    func : callable or None
+        The conversion function, or `None` if no conversion exists
+    '''
+
+    key = (namespace, target_namespace)
+
+    if key not in __CONVERTER__:
+        func = None
+        for source, source_func in __CONVERSION__.get(target_namespace,
+                                                      {}).items():
+            if __SOURCE_PATTERN__[source].match(namespace):
+                func = source_func
+                break
+        __CONVERTER__[key] = func
+
+    return __CONVERTER__[key]
+
+
 def convert(annotation, target_namespace):
     '''Convert a given annotation to the target namespace.
 
@@ -90,14 +126,12 @@ def convert(annotation, target_namespace):
     if annotation.namespace == target_namespace:
         return annotation
 
-    if target_namespace in __CONVERSION__:
-        # Otherwise, make a copy to mangle
-        annotation = deepcopy(annotation)
+    # Look for a way to map this namespace to the target
+    func = _get_conversion(annotation.namespace, target_namespace)
 
-        # Look for a way to map this namespace to the target
-        for source in __CONVERSION__[target_namespace]:
-            if annotation.search(namespace=source):
-                return __CONVERSION__[target_namespace][source](annotation)
+    if func is not None:
+        # Otherwise, make a copy to mangle
+        return func(deepcopy(annotation))
 
     # No conversion possible
     raise NamespaceError('Unable to convert annotation from namespace='
@@ -130,12 +164,8 @@ def can_convert(annotation, target_namespace):
     if annotation.namespace == target_namespace:
         return True
 
-    if target_namespace in __CONVERSION__:
-        # Look for a way to map this namespace to the target
-        for source in __CONVERSION__[target_namespace]:
-            if annotation.search(namespace=source):
-                return True
-    return False
+    # Look for a way to map this namespace to the target
+    return _get_conversion(annotation.namespace, target_namespace) is not None
 
 
 @_conversion('pitch_contour', 'pitch_hz')
@@ -10,14 +10,13 @@ Namespace management
     add_namespace
     namespace
     namespace_array
+    namespace_validator
     is_dense
     values
     get_dtypes
     list_namespaces
 '''
 
-from __future__ import print_function
-
 import json
 import os
 import copy
@@ -28,10 +27,14 @@ import jsonschema
 
 from .exceptions import NamespaceError, JamsError
 
-__all__ = ['add_namespace', 'namespace', 'is_dense', 'values', 'get_dtypes', 'VALIDATOR']
+__all__ = ['add_namespace', 'namespace', 'namespace_validator', 'is_dense',
+           'values', 'get_dtypes', 'VALIDATOR']
 
 __NAMESPACE__ = dict()
 
+# Compiled observation-array validators, keyed by namespace
+__VALIDATORS__ = dict()
+
 
 def add_namespace(filename):
     '''Add a namespace definition to our working set.
@@ -45,7 +48,13 @@ def add_namespace(filename):
         Path to json file defining the namespace object
     '''
     with open(filename, mode='r') as fileobj:
-        __NAMESPACE__.update(json.load(fileobj))
+        ns_defs = json.load(fileobj)
+
+    # Invalidate any validators compiled against old definitions
+    for ns_key in ns_defs:
+        __VALIDATORS__.pop(ns_key, None)
+
+    __NAMESPACE__.update(ns_defs)
 
 
 def namespace(ns_key):
@@ -98,6 +107,36 @@ def namespace_array(ns_key):
     return sch
 
 
+def namespace_validator(ns_key):
+    '''Get a validator for arrays of observations in a given namespace.
+
+    Validators are constructed on first use and cached, so repeated
+    validation of the same namespace does not rebuild its schema.
+    Any `$ref` in the namespace schema is resolved against `JAMS_SCHEMA`.
+
+    Parameters
+    ----------
+    ns_key : str
+        Namespace key identifier
+
+    Returns
+    -------
+    validator : jsonschema.Draft4Validator
+        Validator for the schema given by `namespace_array(ns_key)`
+
+    See Also
+    --------
+    namespace_array
+    '''
+
+    if ns_key not in __VALIDATORS__:
+        resolver = jsonschema.RefResolver.from_schema(JAMS_SCHEMA)
+        __VALIDATORS__[ns_key] = jsonschema.Draft4Validator(
+            namespace_array(ns_key), resolver=resolver)
+
+    return __VALIDATORS__[ns_key]
+
+
 def is_dense(ns_key):
     '''Determine whether a namespace has dense formatting.
 
@@ -33,15 +33,21 @@ def validate(schema_file=None, jams_files=None):
 
     schema = load_json(schema_file)
 
+    # Build the validator once; the schema is checked up front, as
+    # jsonschema.validate() would do for every file
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
     for jams_file in jams_files:
         try:
             jams = load_json(jams_file)
-            jsonschema.validate(jams, schema)
-            print '{:s} was successfully validated'.format(jams_file)
+            validator.validate(jams)
+            print('{:s} was successfully validated'.format(jams_file))
         except jsonschema.ValidationError as exc:
-            print '{:s} was NOT successfully validated'.format(jams_file)
+            print('{:s} was NOT successfully validated'.format(jams_file))
 
-            print exc
+            print(exc)
 
 
 if __name__ == '__main__':
@@ -10,14 +10,15 @@ Sonification
     sonify
 '''
 
+from functools import lru_cache
 from itertools import product
-from collections import OrderedDict, defaultdict
-import six
+from collections import OrderedDict
 import numpy as np
 import mir_eval.sonify
 from mir_eval.util import filter_kwargs
 from .eval import coerce_annotation, hierarchy_flatten
 from .exceptions import NamespaceError
+from .nsconvert import can_convert
 
 __all__ = ['sonify']
 
@@ -29,13 +30,53 @@ def mkclick(freq, sr=22050, duration=0.1):
     but exposes the target frequency and duration.
     '''
 
-    times = np.arange(int(sr * duration))
-    click = np.sin(2 * np.pi * times * freq / float(sr))
-    click *= np.exp(- times / (1e-2 * sr))
+    times = np.arange(int(sr * duration), dtype=np.float64)
 
+    # Evaluate the tone and its decay envelope in place
+    click = np.multiply(times, 2 * np.pi * freq / float(sr))
+    np.sin(click, out=click)
+
+    times *= -1. / (1e-2 * sr)
+    np.exp(times, out=times)
+    click *= times
+
+    return click
+
+
+@lru_cache(maxsize=128)
+def _click_bank(freq, sr, duration):
+    '''Cached, read-only click samples for the internal renderers.'''
+
+    click = mkclick(freq, sr=sr, duration=duration)
+    click.flags.writeable = False
     return click
 
 
+def _add_clicks(y, times, click, sr):
+    '''Mix a click track into `y` (in place) at each of the given times.
+
+    Unlike mir_eval.sonify.clicks, this does not allocate a new output
+    buffer, so several click tracks can be rendered into the same signal.
+
+    Within a track, clicks match mir_eval.sonify.clicks: a click is cut
+    off where the next one starts, rather than overlapping it.  Separate
+    tracks rendered into `y` are summed.
+    '''
+
+    length = len(y)
+
+    starts = np.sort((np.asarray(times) * sr).astype(int))
+    stops = np.minimum(starts + len(click), length)
+    stops[:-1] = np.minimum(stops[:-1], starts[1:])
+
+    for start, stop in zip(starts, stops):
+        if start >= length:
+            break
+        y[start:stop] += click[:stop - start]
+
+    return y
+
+
 def clicks(annotation, sr=22050, length=None, **kwargs):
     '''Sonify events with clicks.
 
@@ -43,9 +84,9 @@ def clicks(annotation, sr=22050, length=None, **kwargs):
     events such as beats or segment boundaries.
     '''
 
-    interval, _ = annotation.to_interval_values()
+    times, _ = annotation.to_event_values()
 
-    return filter_kwargs(mir_eval.sonify.clicks, interval[:, 0],
+    return filter_kwargs(mir_eval.sonify.clicks, times,
                          fs=sr, length=length, **kwargs)
 
 
@@ -53,29 +94,25 @@ def downbeat(annotation, sr=22050, length=None, **kwargs):
     '''Sonify beats and downbeats together.
     '''
 
-    beat_click = mkclick(440 * 2, sr=sr)
-    downbeat_click = mkclick(440 * 3, sr=sr)
+    beat_click = _click_bank(440 * 2, sr, 0.1)
+    downbeat_click = _click_bank(440 * 3, sr, 0.1)
 
     intervals, values = annotation.to_interval_values()
 
-    beats, downbeats = [], []
+    # Positions may be fractional: only an exact 1 marks a downbeat
+    positions = np.fromiter((value['position'] for value in values),
+                            dtype=float, count=len(values))
+    is_down = (positions == 1)
 
-    for time, value in zip(intervals[:, 0], values):
-        if value['position'] == 1:
-            downbeats.append(time)
-        else:
-            beats.append(time)
+    beats = intervals[~is_down, 0]
+    downbeats = intervals[is_down, 0]
 
     if length is None:
         length = int(sr * np.max(intervals)) + len(beat_click) + 1
 
-    y = filter_kwargs(mir_eval.sonify.clicks,
-                      np.asarray(beats),
-                      fs=sr, length=length, click=beat_click)
-
-    y += filter_kwargs(mir_eval.sonify.clicks,
-                       np.asarray(downbeats),
-                       fs=sr, length=length, click=downbeat_click)
+    y = np.zeros(length, dtype=np.float64)
+    _add_clicks(y, beats, beat_click, sr)
+    _add_clicks(y, downbeats, downbeat_click, sr)
 
     return y
 
@@ -92,14 +129,12 @@ def multi_segment(annotation, sr=22050, length=None, **kwargs):
     if length is None:
         length = int(sr * (max(np.max(_) for _ in h_int) + 1. / DURATION) + 1)
 
-    y = 0.0
+    y = np.zeros(length, dtype=np.float64)
     for ints, (oc, scale) in zip(h_int, product(range(3, 3 + len(h_int)),
                                                 PENT)):
-        click = mkclick(440.0 * scale * oc, sr=sr, duration=DURATION)
-        y = y + filter_kwargs(mir_eval.sonify.clicks,
-                              np.unique(ints),
-                              fs=sr, length=length,
-                              click=click)
+        click = _click_bank(440.0 * scale * oc, sr, DURATION)
+        _add_clicks(y, np.unique(ints), click, sr)
+
     return y
 
 
@@ -127,25 +162,35 @@ def pitch_contour(annotation, sr=22050, length=None, **kwargs):
     are summed together.
     '''
 
-    # Map contours to lists of observations
+    intervals, values = annotation.to_interval_values()
+
+    n = len(values)
+    times = intervals[:, 0]
+
+    # The output spans every contour, not just the first one
+    if length is None and n:
+        length = int(times.max() * sr)
+
+    # Unpack the observation values into columns in a single pass
+    obs = np.array([(v['index'], v['frequency'], v['voiced']) for v in values],
+                   dtype=[('index', int), ('frequency', float), ('voiced', bool)])
+
+    # Unvoiced frequencies are encoded by negation
+    freqs = np.where(obs['voiced'], obs['frequency'], -obs['frequency'])
 
-    times = defaultdict(list)
-    freqs = defaultdict(list)
+    # Map contours to the positions of their observations
+    order = np.argsort(obs['index'], kind='mergesort')
+    bounds = np.flatnonzero(np.diff(obs['index'][order])) + 1
+    groups = np.split(order, bounds) if n else []
 
-    for obs in annotation:
-        times[obs.value['index']].append(obs.time)
-        freqs[obs.value['index']].append(obs.value['frequency'] *
-                                         (-1)**(~obs.value['voiced']))
+    y_out = np.zeros(length or 0, dtype=np.float64)
 
-    y_out = 0.0
-    for ix in times:
-        y_out = y_out + filter_kwargs(mir_eval.sonify.pitch_contour,
-                                      np.asarray(times[ix]),
-                                      np.asarray(freqs[ix]),
-                                      fs=sr, length=length,
-                                      **kwargs)
-        if length is None:
-            length = len(y_out)
+    for group in groups:
+        y_out += filter_kwargs(mir_eval.sonify.pitch_contour,
+                               times[group],
+                               freqs[group],
+                               fs=sr, length=length,
+                               **kwargs)
 
     return y_out
 
@@ -160,16 +205,14 @@ def piano_roll(annotation, sr=22050, length=None, **kwargs):
 
     intervals, pitches = annotation.to_interval_values()
 
-    # Construct the pitchogram
-    pitch_map = {f: idx for idx, f in enumerate(np.unique(pitches))}
+    # Construct the pitchogram: one row per unique pitch, one column per note
+    freqs, rows = np.unique(pitches, return_inverse=True)
 
-    gram = np.zeros((len(pitch_map), len(intervals)))
-
-    for col, f in enumerate(pitches):
-        gram[pitch_map[f], col] = 1
+    gram = np.zeros((len(freqs), len(intervals)), dtype=np.float64)
+    gram[rows, np.arange(len(intervals))] = 1
 
     return filter_kwargs(mir_eval.sonify.time_frequency,
-                         gram, pitches, intervals,
+                         gram, freqs, intervals,
                          sr, length=length, **kwargs)
 
 
@@ -184,6 +227,35 @@ SONIFY_MAPPING['note_hz'] = piano_roll
 SONIFY_MAPPING['pitch_contour'] = pitch_contour
 
 
+def _sonify_target(annotation):
+    '''Find the namespace in SONIFY_MAPPING used to sonify an annotation.
+
+    Direct matches are preferred; otherwise the first namespace that
+    `annotation` can be converted to is used.
+
+    Parameters
+    ----------
+    annotation : jams.Annotation
+        The annotation to sonify
+
+    Returns
+    -------
+    target : str or None
+        The key into SONIFY_MAPPING, or `None` if no conversion exists
+    '''
+
+    if annotation.namespace in SONIFY_MAPPING:
+        return annotation.namespace
+
+    # can_convert caches its answers per pair of namespaces, and that
+    # cache is reset whenever a conversion is registered
+    for namespace in SONIFY_MAPPING:
+        if can_convert(annotation, namespace):
+            return namespace
+
+    return None
+
+
 def sonify(annotation, sr=22050, duration=None, **kwargs):
     '''Sonify a jams annotation through mir_eval
 
@@ -204,7 +276,7 @@ def sonify(annotation, sr=22050, duration=None, **kwargs):
     Returns
     -------
     y_sonified : np.ndarray
-        The waveform of the sonified annotation
+        The waveform of the sonified annotation, as `np.float64`.
 
     Raises
     ------
@@ -220,20 +292,16 @@ def sonify(annotation, sr=22050, duration=None, **kwargs):
     if duration is not None:
         length = int(duration * sr)
 
-    # If the annotation can be directly sonified, try that first
-    if annotation.namespace in SONIFY_MAPPING:
-        ann = coerce_annotation(annotation, annotation.namespace)
-        return SONIFY_MAPPING[annotation.namespace](ann,
-                                                    sr=sr,
-                                                    length=length,
-                                                    **kwargs)
-
-    for namespace, func in six.iteritems(SONIFY_MAPPING):
-        try:
-            ann = coerce_annotation(annotation, namespace)
-            return func(ann, sr=sr, length=length, **kwargs)
-        except NamespaceError:
-            pass
-
-    raise NamespaceError('Unable to sonify annotation of namespace="{:s}"'
-                         .format(annotation.namespace))
+    target = _sonify_target(annotation)
+
+    if target is None:
+        raise NamespaceError('Unable to sonify annotation of namespace="{:s}"'
+                             .format(annotation.namespace))
+
+    ann = coerce_annotation(annotation, target)
+
+    # Nothing to synthesize: return silence
+    if not ann.data:
+        return np.zeros(length or 0, dtype=np.float64)
+
+    return SONIFY_MAPPING[target](ann, sr=sr, length=length, **kwargs)
@@ -15,7 +15,7 @@ Utility functions
 """
 
 import os
-import glob
+import fnmatch
 import pandas as pd
 
 from . import core
@@ -211,12 +211,30 @@ def find_with_extension(in_dir, ext, depth=3, sort=True):
 
     """
     assert depth >= 1
-    ext = ext.strip(os.extsep)
+    pattern = '*' + os.extsep + ext.strip(os.extsep)
     match = list()
-    for n in range(1, depth+1):
-        wildcard = os.path.sep.join(["*"]*n)
-        search_path = os.path.join(in_dir, os.extsep.join([wildcard, ext]))
-        match += glob.glob(search_path)
+
+    # Breadth-first scan; scandir entries carry their own type information,
+    # so this avoids a stat call per path.  Names are matched with fnmatch
+    # and hidden entries are skipped, just as in glob.
+    level = [in_dir]
+    for _ in range(depth):
+        subdirs = list()
+        for path in level:
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                # Missing or unreadable directories have no matches
+                continue
+
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if fnmatch.fnmatch(entry.name, pattern):
+                    match.append(os.path.join(path, entry.name))
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+        level = subdirs
 
     if sort:
         match.sort()
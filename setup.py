@@ -32,10 +32,7 @@ setup(
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "Topic :: Multimedia :: Sound/Audio :: Analysis",
-        "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.4",
         "Programming Language :: Python :: 3.5",
         "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
@@ -43,13 +40,12 @@ setup(
     ],
     keywords='audio music json',
     license='ISC',
+    python_requires='>=3.5',
     install_requires=[
         'pandas',
         'sortedcontainers>=2.0.0',
-        'pyrsistent<0.15; python_version=="3.4"',
         'jsonschema>=3.0.0',
         'numpy>=1.8.0',
-        'six',
         'decorator',
         'mir_eval>=0.5',
     ],
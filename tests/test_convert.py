@@ -300,3 +300,41 @@ def test_can_convert_fail():
 
     ann = jams.Annotation(namespace='tag_gtzan')
     assert not jams.nsconvert.can_convert(ann, 'chord')
+
+
+def test_can_convert_cached():
+
+    ann = jams.Annotation(namespace='tag_gtzan')
+    ann.append(time=0, duration=1, value='blues', confidence=1)
+
+    # Repeated queries give the same answers
+    for _ in range(2):
+        assert jams.nsconvert.can_convert(ann, 'tag_open')
+        assert not jams.nsconvert.can_convert(ann, 'tag_msd')
+        assert jams.convert(ann, 'tag_open').namespace == 'tag_open'
+
+
+def test_conversion_registered_after_miss():
+
+    ann = jams.Annotation(namespace='tag_gtzan')
+    ann.append(time=0, duration=1, value='blues', confidence=1)
+
+    # Query before the conversion exists, so that the miss is cached
+    assert not jams.nsconvert.can_convert(ann, 'tag_msd')
+
+    def gtzan_to_msd(annotation):
+        annotation.namespace = 'tag_msd'
+        return annotation
+
+    jams.nsconvert._conversion('tag_msd', 'tag_gtzan')(gtzan_to_msd)
+
+    try:
+        assert jams.nsconvert.can_convert(ann, 'tag_msd')
+        assert jams.convert(ann, 'tag_msd').namespace == 'tag_msd'
+    finally:
+        # Unregister the test conversion
+        del jams.nsconvert.__CONVERSION__['tag_msd']
+        del jams.nsconvert.__SOURCE_PATTERN__['tag_gtzan']
+        jams.nsconvert.__CONVERTER__.clear()
+
+    assert not jams.nsconvert.can_convert(ann, 'tag_msd')
@@ -2,18 +2,16 @@
 # -*- encoding: utf-8 -*-
 '''mir_eval integration tests'''
 
+import copy
+
 import numpy as np
 import pytest
 import jams
 
-from test_util import srand
-
 
 # Fixtures
 def create_annotation(values, namespace='beat', offset=0.0, duration=1,
                       confidence=1):
-    ann = jams.Annotation(namespace=namespace)
-
     time = np.arange(offset, offset + len(values))
 
     if np.isscalar(duration):
@@ -23,26 +21,26 @@ def create_annotation(values, namespace='beat', offset=0.0, duration=1,
     if np.isscalar(confidence):
         confidence = [confidence] * len(time)
 
-    for t, d, v, c in zip(time, duration, values, confidence):
-        ann.append(time=t, duration=d, value=v, confidence=c)
-
-    return ann
+    return jams.Annotation(namespace=namespace,
+                           data=dict(time=time, duration=duration,
+                                     value=values, confidence=confidence))
 
 
 def create_hierarchy(values, offset=0.0, duration=20):
-    ann = jams.Annotation(namespace='multi_segment')
+    data = dict(time=[], duration=[], value=[], confidence=[])
 
     for level, labels in enumerate(values):
         times = np.linspace(offset, offset + duration, num=len(labels),
                             endpoint=False)
 
-        durations = list(np.diff(times))
-        durations.append(duration + offset - times[-1])
+        durations = np.diff(np.concatenate([times, [offset + duration]]))
 
-        for t, d, v in zip(times, durations, labels):
-            ann.append(time=t, duration=d, value=dict(label=v, level=level))
+        data['time'].extend(times)
+        data['duration'].extend(durations)
+        data['value'].extend(dict(label=v, level=level) for v in labels)
+        data['confidence'].extend([None] * len(labels))
 
-    return ann
+    return jams.Annotation(namespace='multi_segment', data=data)
 
 
 @pytest.fixture(scope='module')
@@ -136,23 +134,24 @@ def est_tag():
 
 
 @pytest.fixture(scope='module')
-def ref_melody():
+def melody_values():
 
-    srand()
+    rng = np.random.RandomState(628318530)
     freq = np.linspace(110.0, 440.0, 10)
-    voice = np.sign(np.random.randn(len(freq)))
-    return create_annotation(values=freq * voice, confidence=1.0,
+    voice = np.sign(rng.randn(len(freq)))
+    return freq * voice
+
+
+@pytest.fixture(scope='module')
+def ref_melody(melody_values):
+    return create_annotation(values=melody_values, confidence=1.0,
                              duration=0.01,
                              namespace='pitch_hz')
 
 
 @pytest.fixture(scope='module')
-def est_melody():
-
-    srand()
-    freq = np.linspace(110.0, 440.0, 10)
-    voice = np.sign(np.random.randn(len(freq)))
-    return create_annotation(values=freq * voice, confidence=1.0,
+def est_melody(melody_values):
+    return create_annotation(values=melody_values, confidence=1.0,
                              duration=0.01,
                              namespace='pitch_hz')
 
@@ -210,9 +209,8 @@ def est_transcript():
 
 
 @pytest.fixture(scope='module')
-def est_badtranscript():
-    est_jam = jams.load('tests/fixtures/transcription_est.jams', validate=False)
-    ann = est_jam.annotations['pitch_hz', 0]
+def est_badtranscript(est_transcript):
+    ann = copy.deepcopy(est_transcript)
     ann.append(time=2., duration=1., value=None, confidence=1)
     return ann
 
@@ -6,11 +6,11 @@
 import os
 import tempfile
 import json
-import six
-import sys
+import copy
 import warnings
 
 import pytest
+import jsonschema
 import numpy as np
 
 import jams
@@ -20,18 +20,6 @@ xfail = pytest.mark.xfail
 parametrize = pytest.mark.parametrize
 
 
-# Borrowed from sklearn
-def clean_warning_registry():
-    """Safe way to reset warnings """
-    warnings.resetwarnings()
-    reg = "__warningregistry__"
-    for mod_name, mod in list(sys.modules.items()):
-        if 'six.moves' in mod_name:
-            continue
-        if hasattr(mod, reg):
-            getattr(mod, reg).clear()
-
-
 # JObject
 
 def test_jobject_dict():
@@ -123,7 +111,7 @@ def test_sandbox():
 
     J = jams.Sandbox(**data)
 
-    for key, value in six.iteritems(data):
+    for key, value in data.items():
         assert value == J[key]
 
 
@@ -298,9 +286,8 @@ def test_filemetadata_validation(strict):
                            release='Test release',
                            duration=None)
 
-    clean_warning_registry()
-
     with warnings.catch_warnings(record=True) as out:
+        warnings.simplefilter('always')
         fm.validate(strict=strict)
 
         assert len(out) > 0
@@ -432,7 +419,8 @@ def test_jams(tag_data, file_metadata, ann_sandbox):
 @pytest.fixture(params=['jams', 'jamz'])
 def output_path(request):
 
-    _, jam_out = tempfile.mkstemp(suffix='.{:s}'.format(request.param))
+    fd, jam_out = tempfile.mkstemp(suffix='.{:s}'.format(request.param))
+    os.close(fd)
 
     yield jam_out
 
@@ -451,16 +439,14 @@ def test_jams_save(input_jam, output_path):
     assert input_jam == reload_jam
 
 
-def test_jams_add(tag_data):
-
-    fn = 'tests/fixtures/valid.jams'
+def test_jams_add(input_jam, tag_data):
 
     # The original jam
-    jam_orig = jams.load(fn)
-    jam = jams.load(fn)
+    jam_orig = input_jam
+    jam = copy.deepcopy(input_jam)
 
     # Make a new jam with the same metadata and different data
-    jam2 = jams.load(fn)
+    jam2 = copy.deepcopy(input_jam)
     ann = jams.Annotation('tag_open', data=tag_data)
     jam2.annotations = jams.AnnotationArray(annotations=[ann])
 
@@ -476,15 +462,14 @@ def test_jams_add(tag_data):
              ['overwrite', 'ignore',
               xfail('fail', raises=jams.JamsError),
               xfail('bad_fail_mdoe', raises=jams.ParameterError)])
-def test_jams_add_conflict(on_conflict):
-    fn = 'tests/fixtures/valid.jams'
+def test_jams_add_conflict(input_jam, on_conflict):
 
     # The original jam
-    jam = jams.load(fn)
-    jam_orig = jams.load(fn)
+    jam = copy.deepcopy(input_jam)
+    jam_orig = input_jam
 
     # The copy
-    jam2 = jams.load(fn)
+    jam2 = copy.deepcopy(input_jam)
 
     jam2.file_metadata = jams.FileMetadata()
 
@@ -536,9 +521,8 @@ def jam_validate():
 @parametrize('strict', [False, xfail(True, raises=jams.SchemaError)])
 def test_jams_validate_bad(jam_validate, strict):
 
-    clean_warning_registry()
-
     with warnings.catch_warnings(record=True) as out:
+        warnings.simplefilter('always')
         jam_validate.validate(strict=strict)
 
     assert len(out) > 0
@@ -560,9 +544,8 @@ def test_jams_bad_annotation(strict):
 
     jam.annotations.append('not an annotation')
 
-    clean_warning_registry()
-
     with warnings.catch_warnings(record=True) as out:
+        warnings.simplefilter('always')
         jam.validate(strict=strict)
 
     assert len(out) > 0
@@ -574,9 +557,8 @@ def test_jams_bad_annotation(strict):
 def test_jams_bad_jam(strict):
     jam = jams.JAMS()
 
-    clean_warning_registry()
-
     with warnings.catch_warnings(record=True) as out:
+        warnings.simplefilter('always')
         jam.validate(strict=strict)
 
     assert len(out) > 0
@@ -603,25 +585,23 @@ def test_load_fail():
     # 3. test bad extensions
     # 4. test bad codecs
 
-    # Make a non-existent file
+    # One scratch directory serves all cases
     tdir = tempfile.mkdtemp()
+    badfile = os.path.join(tdir, 'nonexistent.jams')
+
+    # Load a non-existent file
     with pytest.raises(IOError):
-        jams.load(os.path.join(tdir, 'nonexistent.jams'), fmt='jams')
-    os.rmdir(tdir)
+        jams.load(badfile, fmt='jams')
 
     # Make a non-json file
-    tdir = tempfile.mkdtemp()
-    badfile = os.path.join(tdir, 'nonexistent.jams')
     with open(badfile, mode='w') as fp:
         fp.write('some garbage')
 
     with pytest.raises(ValueError):
-        jams.load(os.path.join(tdir, 'nonexistent.jams'), fmt='jams')
+        jams.load(badfile, fmt='jams')
 
     os.unlink(badfile)
-    os.rmdir(tdir)
 
-    tdir = tempfile.mkdtemp()
     for ext in ['txt', '']:
         badfile = os.path.join(tdir, 'nonexistent')
         with pytest.raises(jams.ParameterError):
@@ -644,20 +624,34 @@ def test_load_valid():
     # 4. test good jams file without strict validation
     fn = 'tests/fixtures/valid'
 
+    # strict has no effect without validation, so skip that repeat load
     for ext in ['jams', 'jamz']:
-        for validate in [False, True]:
-            for strict in [False, True]:
-                jams.load('{:s}.{:s}'.format(fn, ext),
-                          validate=validate,
-                          strict=strict)
+        for validate, strict in [(False, False), (True, False), (True, True)]:
+            jams.load('{:s}.{:s}'.format(fn, ext),
+                      validate=validate,
+                      strict=strict)
+
+
+def test_load_reuses_validators(monkeypatch):
+
+    fn = 'tests/fixtures/valid.jams'
+
+    # Warm up the validator cache
+    jams.load(fn, validate=True)
+
+    def __no_validator(*args, **kwargs):
+        raise AssertionError('schema validator was rebuilt')
+
+    # Subsequent loads must not compile any schemas
+    monkeypatch.setattr(jsonschema, 'Draft4Validator', __no_validator)
+    jams.load(fn, validate=True, strict=True)
 
 
 def test_load_invalid():
 
     def __test_warn(filename, valid, strict):
-        clean_warning_registry()
-
         with warnings.catch_warnings(record=True) as out:
+            warnings.simplefilter('always')
             jams.load(filename, validate=valid, strict=strict)
 
         assert len(out) > 0
@@ -691,8 +685,8 @@ def test_annotation_trim_no_duration():
     ann = jams.Annotation('tag_open')
     ann.duration = None
 
-    clean_warning_registry()
     with warnings.catch_warnings(record=True) as out:
+        warnings.simplefilter('always')
         ann_trim = ann.trim(3, 5)
 
     assert len(out) > 0
@@ -707,8 +701,8 @@ def test_annotation_trim_no_duration():
     ann.duration = None
     ann.append(time=5, duration=2, value='one')
 
-    clean_warning_registry()
     with warnings.catch_warnings(record=True) as out:
+        warnings.simplefilter('always')
         ann_trim = ann.trim(5, 8)
 
     assert len(out) > 0
@@ -736,8 +730,8 @@ def test_annotation_trim_no_overlap():
 
     for tt in trim_times[:2]:
 
-        clean_warning_registry()
         with warnings.catch_warnings(record=True) as out:
+            warnings.simplefilter('always')
             ann_trim = ann.trim(*tt)
 
         assert len(out) > 0
@@ -1164,9 +1158,8 @@ def test_deprecated():
     def _foo():
         pass
 
-    warnings.resetwarnings()
-    warnings.simplefilter('always')
     with warnings.catch_warnings(record=True) as out:
+        warnings.simplefilter('always')
         _foo()
 
         # And that the warning triggered
@@ -2,7 +2,7 @@
 # CREATED:2015-07-15 10:21:30 by Brian McFee <brian.mcfee@nyu.edu>
 '''Namespace management tests'''
 
-from six.moves import reload_module
+from importlib import reload
 
 import pytest
 import os
@@ -41,14 +41,14 @@ def test_schema_is_dense(ns, dense):
 def local_namespace():
 
     os.environ['JAMS_SCHEMA_DIR'] = os.path.join('tests', 'fixtures', 'schema')
-    reload_module(jams)
+    reload(jams)
 
     # This one should pass
     yield 'testing_tag_upper', True
 
     # Cleanup
     del os.environ['JAMS_SCHEMA_DIR']
-    reload_module(jams)
+    reload(jams)
 
 
 def test_schema_local(local_namespace):
@@ -71,6 +71,22 @@ def test_schema_local(local_namespace):
             schema = jams.schema.namespace(ns_key)
 
 
+@pytest.mark.parametrize('ns_key',
+                         ['pitch_hz', 'beat',
+                          pytest.mark.xfail('DNE', raises=NamespaceError)])
+def test_schema_namespace_validator(ns_key):
+
+    validator = jams.schema.namespace_validator(ns_key)
+
+    # Validators are cached
+    assert validator is jams.schema.namespace_validator(ns_key)
+    assert validator.schema == jams.schema.namespace_array(ns_key)
+
+    # References resolve against the full JAMS schema
+    _, curator = validator.resolver.resolve('#/definitions/Curator')
+    assert curator == jams.schema.JAMS_SCHEMA['definitions']['Curator']
+
+
 def test_schema_values_pass():
 
     values = jams.schema.values('tag_gtzan')
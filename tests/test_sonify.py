@@ -4,6 +4,7 @@
 
 import numpy as np
 import pytest
+import mir_eval.sonify
 from test_eval import create_hierarchy
 
 import jams
@@ -24,6 +25,29 @@ def test_bad_sonify():
     jams.sonify.sonify(ann)
 
 
+@pytest.mark.parametrize('ns, value',
+                         [('beat', 1),
+                          ('segment_open', 'a'),
+                          ('chord', 'C:maj'),
+                          ('note_midi', 60),
+                          ('pitch_contour', dict(index=0, frequency=440.0,
+                                                 voiced=True)),
+                          ('multi_segment', dict(label='a', level=0))])
+@pytest.mark.parametrize('duration', [None, 2.0])
+def test_empty(ns, value, duration):
+    ann = jams.Annotation(namespace=ns)
+
+    y = jams.sonify.sonify(ann, sr=8000, duration=duration)
+
+    assert len(y) == int(8000 * (duration or 0))
+    assert not np.any(y)
+
+    # Silence must have the same dtype as a rendered annotation
+    ann.append(time=0.5, duration=1.0, value=value)
+    y_full = jams.sonify.sonify(ann, sr=8000, duration=duration)
+    assert y.dtype == y_full.dtype
+
+
 @pytest.mark.parametrize('ns', ['segment_open', 'chord'])
 @pytest.mark.parametrize('sr', [8000, 11025])
 @pytest.mark.parametrize('duration', [None, 5.0, 1.0])
@@ -55,6 +79,17 @@ def test_note_hz_nolength():
     assert np.any(y)
 
 
+def test_note_hz_repeated():
+    ann = jams.Annotation(namespace='note_hz')
+    ann.append(time=0, duration=0.5, value=261.0)
+    ann.append(time=0.5, duration=0.5, value=440.0)
+    ann.append(time=1, duration=0.5, value=261.0)
+    y = jams.sonify.sonify(ann, sr=8000, duration=2.0)
+
+    assert len(y) == 8000 * 2
+    assert np.any(y[int(8000 * 1.1):int(8000 * 1.4)])
+
+
 def test_note_midi():
     ann = jams.Annotation(namespace='note_midi')
     ann.append(time=0, duration=1, value=60)
@@ -90,6 +125,47 @@ def test_contour(ann_contour, duration, sr):
         assert len(y) == sr * duration
 
 
+def test_contour_multi():
+    sr = 8000
+    times = np.linspace(0, 2, num=200, endpoint=False)
+
+    ann = jams.Annotation(namespace='pitch_contour')
+    ann_a = jams.Annotation(namespace='pitch_contour')
+    ann_b = jams.Annotation(namespace='pitch_contour')
+
+    # Interleave two contours with distinct frequencies
+    for t in times:
+        for idx, freq, sub in [(0, 220., ann_a), (1, 330., ann_b)]:
+            value = {'frequency': freq, 'index': idx, 'voiced': t < 1.5}
+            ann.append(time=t, duration=0.01, value=value)
+            sub.append(time=t, duration=0.01, value=value)
+
+    y = jams.sonify.sonify(ann, sr=sr, duration=2.0)
+    y_a = jams.sonify.sonify(ann_a, sr=sr, duration=2.0)
+    y_b = jams.sonify.sonify(ann_b, sr=sr, duration=2.0)
+
+    assert np.allclose(y, y_a + y_b, atol=1e-6)
+
+
+def test_contour_unequal_spans():
+    sr = 8000
+    ann = jams.Annotation(namespace='pitch_contour')
+
+    # A long contour with a high index, and a short one with a low index
+    for t in np.linspace(0, 10, num=101):
+        ann.append(time=t, duration=0.1,
+                   value={'frequency': 220., 'index': 5, 'voiced': True})
+    for t in np.linspace(8, 9, num=11):
+        ann.append(time=t, duration=0.1,
+                   value={'frequency': 330., 'index': 0, 'voiced': True})
+
+    y = jams.sonify.sonify(ann, sr=sr)
+
+    # The output covers the longest contour
+    assert len(y) == 10 * sr
+    assert np.any(y[int(9.5 * sr):])
+
+
 @pytest.mark.parametrize('namespace', ['chord', 'chord_harte'])
 @pytest.mark.parametrize('sr', [8000])
 @pytest.mark.parametrize('duration', [2.0])
@@ -135,10 +211,28 @@ def beat_pos_ann():
 def test_beat_position(beat_pos_ann, sr, duration):
 
     yout = jams.sonify.sonify(beat_pos_ann, sr=sr, duration=duration)
+    assert yout.dtype == np.float64
     if duration is not None:
         assert len(yout) == duration * sr
 
 
+def test_beat_position_fractional():
+    sr = 8000
+    ann = jams.Annotation(namespace='beat_position')
+
+    for t, pos in [(0, 1), (0.5, 1.5), (1.0, 2)]:
+        ann.append(time=t, duration=0,
+                   value=dict(position=pos, measure=1,
+                              num_beats=4, beat_units=4))
+
+    y = jams.sonify.sonify(ann, sr=sr, duration=2.0)
+
+    # A fractional position is a beat, not a downbeat
+    beat_click = jams.sonify.mkclick(440 * 2, sr=sr)
+    start = int(0.5 * sr)
+    assert np.allclose(y[start:start + len(beat_click)], beat_click)
+
+
 @pytest.fixture(scope='module')
 def ann_hier():
     return create_hierarchy(values=['AB', 'abac', 'xxyyxxzz'], duration=30)
@@ -150,3 +244,55 @@ def test_multi_segment(ann_hier, sr, duration):
     y = jams.sonify.sonify(ann_hier, sr=sr, duration=duration)
     if duration:
         assert len(y) == duration * sr
+
+
+@pytest.mark.parametrize('times', [[0.5, 0.55, 1.0],
+                                   [0.5, 0.5, 0.52, 1.95],
+                                   [2.5]])
+def test_add_clicks_overlap(times):
+    sr = 8000
+    click = jams.sonify.mkclick(880.0, sr=sr)
+
+    y = np.zeros(2 * sr)
+    jams.sonify._add_clicks(y, times, click, sr)
+
+    # Closely spaced clicks must not stack up
+    y_ref = mir_eval.sonify.clicks(np.asarray(times), fs=sr,
+                                   click=click, length=len(y))
+    assert np.allclose(y, y_ref)
+
+
+def test_mkclick_writeable():
+    c1 = jams.sonify.mkclick(440.0, sr=8000, duration=0.1)
+    c2 = jams.sonify.mkclick(440.0, sr=8000, duration=0.1)
+
+    # Each call returns a fresh array that callers may modify
+    assert c1 is not c2
+    assert len(c1) == 800
+    c1 *= 0.5
+    assert np.allclose(c1, 0.5 * c2)
+
+
+def test_click_bank_cached():
+    c1 = jams.sonify._click_bank(440.0, 8000, 0.1)
+    c2 = jams.sonify._click_bank(440.0, 8000, 0.1)
+
+    assert c1 is c2
+    assert not c1.flags.writeable
+    assert np.allclose(c1, jams.sonify.mkclick(440.0, sr=8000, duration=0.1))
+
+
+def test_sonify_mapping_update():
+    ann = jams.Annotation(namespace='vector')
+    ann.append(time=0, duration=1, value=[1.0])
+
+    with pytest.raises(jams.NamespaceError):
+        jams.sonify.sonify(ann, sr=8000)
+
+    # Registering a new mapping takes effect immediately
+    jams.sonify.SONIFY_MAPPING['vector'] = jams.sonify.clicks
+    try:
+        y = jams.sonify.sonify(ann, sr=8000, duration=1.0)
+        assert len(y) == 8000
+    finally:
+        del jams.sonify.SONIFY_MAPPING['vector']
@@ -4,15 +4,13 @@
 
 import tempfile
 import os
+from io import StringIO
 import pytest
 import numpy as np
 
 from jams import core, util
 
 
-import six
-
-
 def srand(seed=628318530):
     np.random.seed(seed)
     pass
@@ -40,7 +38,7 @@ def srand(seed=628318530):
                            ['c', 'd'],
                            False)])
 def test_import_lab(ns, lab, ints, y, infer_duration):
-    ann = util.import_lab(ns, six.StringIO(lab),
+    ann = util.import_lab(ns, StringIO(lab),
                           infer_duration=infer_duration)
 
     assert len(ints) == len(ann.data)
@@ -142,6 +140,21 @@ def test_find_with_extension(root_and_files, level, sort):
     assert sorted(results) == sorted(files[:level])
 
 
+@pytest.mark.parametrize('ext', ['t?t', '.t*', '[st]xt'])
+def test_find_with_extension_pattern(root_and_files, ext):
+    root, files = root_and_files
+    results = util.find_with_extension(root, ext, depth=4)
+
+    assert results == sorted(files)
+
+
+def test_find_with_extension_missing():
+    root = tempfile.mkdtemp()
+    os.rmdir(root)
+
+    assert util.find_with_extension(root, 'txt') == []
+
+
 def test_expand_filepaths():
 
     targets = ['foo.bar', 'dir/file.txt', 'dir2///file2.txt', '/q.bin']